@@ -1,24 +1,23 @@
 import inspect
 import json as json_module
 import logging
+import re
+from functools import lru_cache
 from functools import partialmethod
 from functools import wraps
 from http import client
-from itertools import groupby
 from re import Pattern
 from threading import Lock as _ThreadingLock
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
+from typing import Counter
 from typing import Dict
 from typing import Iterable
-from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import NamedTuple
 from typing import Optional
-from typing import Sequence
-from typing import Sized
 from typing import Tuple
 from typing import Type
 from typing import Union
@@ -105,6 +104,18 @@ _UNSET = object()
 
 logger = logging.getLogger("responses")
 
+# used as 'safe' argument of 'quote' to percent-encode only non-ASCII characters
+_ASCII_CHARS = "".join(map(chr, range(128)))
+
+# URL path characters that ``urllib3.util.url.parse_url`` leaves untouched
+_URL_PATH_SAFE_RE = re.compile(r"[\w\-.~!$&'()*+,;=:@/]*", re.ASCII)
+# plain 'host[:port]' netloc, only the host case is normalized by urllib3 for those
+_URL_NETLOC_PLAIN_RE = re.compile(r"[A-Za-z0-9.\-]+(?::[1-9][0-9]{0,3})?")
+# URL starting with a scheme and a plain netloc, see ``_URL_NETLOC_PLAIN_RE``
+_URL_PLAIN_PREFIX_RE = re.compile(
+    r"[A-Za-z][A-Za-z0-9+.\-]*://[A-Za-z0-9.\-]+(?::[1-9][0-9]{0,3})?(?:[/?#]|$)"
+)
+
 
 class FalseBool:
     """Class to mock up built-in False boolean.
@@ -133,8 +144,33 @@ def json_params_matcher(params: Optional[Dict[str, Any]]) -> Callable[..., Any]:
     return _json_params_matcher(params)
 
 
+# canonical instances of the common HTTP methods, see `_canonical_method`
+_KNOWN_METHODS = {
+    method: method
+    for method in ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+}
+
+
+def _canonical_method(method: str) -> str:
+    """Uppercase the HTTP method like `requests` does for the request method.
+
+    Known methods are returned as the same interned string instance.
+    """
+    method = method.upper()
+    return _KNOWN_METHODS.get(method, method)
+
+
+def _warn_stream_deprecated() -> None:
+    # Warned on every use on purpose: a process wide "warn once" flag would hide the
+    # warning from all but the first test asserting it, eg with `pytest.deprecated_call`
+    warn(
+        "stream argument is deprecated. Use stream parameter in request directly",
+        DeprecationWarning,
+    )
+
+
 def _has_unicode(s: str) -> bool:
-    return any(ord(char) > 128 for char in s)
+    return not s.isascii()
 
 
 def _clean_unicode(url: str) -> str:
@@ -153,24 +189,26 @@ def _clean_unicode(url: str) -> str:
         Cleaned URL
 
     """
+    if url.isascii():
+        return url
+
     urllist = list(urlsplit(url))
     netloc = urllist[1]
     if _has_unicode(netloc):
-        domains = netloc.split(".")
-        for i, d in enumerate(domains):
-            if _has_unicode(d):
-                d = "xn--" + d.encode("punycode").decode("ascii")
-                domains[i] = d
-        urllist[1] = ".".join(domains)
+        # only the host is punycoded, keep userinfo and port out of the labels
+        userinfo, at, host = netloc.rpartition("@")
+        host, colon, port = host.partition(":")
+        # Encode labels one by one instead of `str.encode("idna")`: the IDNA 2003 codec
+        # maps some characters (eg 'ß' to 'ss') unlike IDNA 2008 used by `requests`
+        host = ".".join(
+            label if label.isascii() else "xn--" + label.encode("punycode").decode()
+            for label in host.split(".")
+        )
+        urllist[1] = userinfo + at + host + colon + port
         url = urlunsplit(urllist)
 
     # Clean up path/query/params, which use url-encoding to handle unicode chars
-    chars = list(url)
-    for i, x in enumerate(chars):
-        if ord(x) > 128:
-            chars[i] = quote(x)
-
-    return "".join(chars)
+    return quote(url, safe=_ASCII_CHARS)
 
 
 def get_wrapped(
@@ -234,37 +272,75 @@ def get_wrapped(
     return wrapper
 
 
-class CallList(Sequence[Any], Sized):
+class CallList(List[Call]):
     def __init__(self) -> None:
-        self._calls: List[Call] = []
+        super().__init__()
+        # number of calls per request URL, see `RequestsMock.assert_call_count`.
+        # Kept up to date by `append`, other list mutations drop it to be recounted.
+        self._url_counts: Optional[Counter[Optional[str]]] = Counter()
 
-    def __iter__(self) -> Iterator[Call]:
-        return iter(self._calls)
+    def add(self, request: "PreparedRequest", response: "_Body") -> None:
+        self.add_call(Call(request, response))
 
-    def __len__(self) -> int:
-        return len(self._calls)
+    def add_call(self, call: Call) -> None:
+        self.append(call)
 
-    @overload
-    def __getitem__(self, idx: int) -> Call:
-        ...
+    def reset(self) -> None:
+        self.clear()
 
-    @overload
-    def __getitem__(self, idx: "slice[int, int, Optional[int]]") -> List[Call]:
-        ...
+    def __reduce_ex__(self, protocol: Any) -> Tuple[Any, ...]:
+        # copies are rebuilt through `__init__` and `append`, sharing or copying the
+        # counts would count the replayed calls twice
+        return type(self), (), None, iter(self)
 
-    def __getitem__(self, idx: Union[int, slice]) -> Union[Call, List[Call]]:
-        return self._calls[idx]
+    def _url_call_count(self, url: Optional[str]) -> int:
+        if self._url_counts is None:
+            self._url_counts = Counter(call.request.url for call in self)
+        return self._url_counts[url]
 
-    def add(self, request: "PreparedRequest", response: "_Body") -> None:
-        self._calls.append(Call(request, response))
+    def append(self, call: Call) -> None:
+        super().append(call)
+        if self._url_counts is not None:
+            self._url_counts[call.request.url] += 1
 
-    def add_call(self, call: Call) -> None:
-        self._calls.append(call)
+    def extend(self, calls: Iterable[Call]) -> None:
+        self._url_counts = None
+        super().extend(calls)
 
-    def reset(self) -> None:
-        self._calls = []
+    def insert(self, index: Any, call: Call) -> None:
+        self._url_counts = None
+        super().insert(index, call)
+
+    def pop(self, index: Any = -1) -> Call:
+        self._url_counts = None
+        return super().pop(index)
+
+    def remove(self, call: Call) -> None:
+        self._url_counts = None
+        super().remove(call)
 
+    def clear(self) -> None:
+        self._url_counts = None
+        super().clear()
 
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._url_counts = None
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self._url_counts = None
+        super().__delitem__(index)
+
+    def __iadd__(self, calls: Iterable[Call]) -> "CallList":  # type: ignore[override,misc]
+        self._url_counts = None
+        return super().__iadd__(calls)
+
+    def __imul__(self, n: Any) -> "CallList":  # type: ignore[misc]
+        self._url_counts = None
+        return super().__imul__(n)
+
+
+@lru_cache(maxsize=2048)
 def _ensure_url_default_path(
     url: "_URLPatternType",
 ) -> "_URLPatternType":
@@ -294,6 +370,7 @@ def _ensure_url_default_path(
     return url
 
 
+@lru_cache(maxsize=256)
 def _get_url_and_path(url: str) -> str:
     """Construct URL only containing scheme, netloc and path by truncating other parts.
 
@@ -317,36 +394,24 @@ def _get_url_and_path(url: str) -> str:
 
     """
     url_parsed = urlsplit(url)
-    url_and_path = urlunparse(
-        [url_parsed.scheme, url_parsed.netloc, url_parsed.path, None, None, None]
-    )
+    scheme, netloc, path = url_parsed.scheme, url_parsed.netloc, url_parsed.path
+    if (
+        scheme in ("http", "https")
+        and _URL_NETLOC_PLAIN_RE.fullmatch(netloc)
+        and "/." not in path
+        and _URL_PATH_SAFE_RE.fullmatch(path)
+    ):
+        # nothing to normalize apart from the host case, skip full URL parsing
+        return f"{scheme}://{netloc.lower()}{path}"
+
+    url_and_path = urlunparse([scheme, netloc, path, None, None, None])
     return parse_url(url_and_path).url
 
 
-def _handle_body(
-    body: Optional[Union[bytes, BufferedReader, str]]
-) -> Union[BufferedReader, BytesIO]:
-    """Generates `Response` body.
+class _MockBody(BytesIO):
+    """`BytesIO` used as `Response` body."""
 
-    Parameters
-    ----------
-    body : str or bytes or BufferedReader
-        Input data to generate `Response` body.
-
-    Returns
-    -------
-    body : BufferedReader or BytesIO
-        `Response` body
-
-    """
-    if isinstance(body, str):
-        body = body.encode("utf-8")
-    if isinstance(body, BufferedReader):
-        return body
-
-    data = BytesIO(body)  # type: ignore[arg-type]
-
-    def is_closed() -> bool:
+    def isclosed(self) -> bool:
         """
         Real Response uses HTTPResponse as body object.
         Thus, when method is_closed is called first to check if there is any more
@@ -358,29 +423,83 @@ def _handle_body(
 
         where file should be intentionally be left opened to continue consumption
         """
-        if not data.closed and data.read(1):
+        if not self.closed and self.read(1):
             # if there is more bytes to read then keep open, but return pointer
-            data.seek(-1, 1)
+            self.seek(-1, 1)
             return False
         else:
-            if not data.closed:
+            if not self.closed:
                 # close but return False to mock like is still opened
-                data.close()
+                self.close()
                 return False
 
             # only if file really closed (by us) return True
             return True
 
-    data.isclosed = is_closed  # type: ignore[attr-defined]
-    return data
+
+def _get_request_index_key(request: "PreparedRequest") -> Optional[Tuple[str, str]]:
+    """Key of the request to look up matching responses, see ``BaseResponse._get_index_key``."""
+    if request.method is None:
+        return None
+    try:
+        return request.method, _get_url_and_path(str(request.url))
+    except ValueError:
+        return None
+
+
+def _handle_body(
+    body: Optional[Union[bytes, BufferedReader, str]]
+) -> Union[BufferedReader, BytesIO]:
+    """Generates `Response` body.
+
+    Parameters
+    ----------
+    body : str or bytes or BufferedReader
+        Input data to generate `Response` body.
+
+    Returns
+    -------
+    body : BufferedReader or BytesIO
+        `Response` body
+
+    """
+    # exact type checks first, 'str' and 'bytes' bodies are the most common ones
+    body_type = type(body)
+    if body_type is str:
+        body = body.encode("utf-8")  # type: ignore[union-attr]
+    elif body_type is not bytes:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif isinstance(body, BufferedReader):
+            return body
+
+    return _MockBody(body)  # type: ignore[arg-type]
 
 
 class BaseResponse:
-    passthrough: bool = False
+    # tests may register thousands of responses, avoid a per-instance __dict__
+    __slots__ = (
+        "_method",
+        "_url",
+        "match",
+        "passthrough",
+        "status",
+        "_body",
+        "_url_and_path",
+        "_url_prefix",
+        "_calls",
+        "_cmp_key",
+        "__weakref__",
+    )
+    # class level defaults, subclasses may override them
     content_type: Optional[str] = None
     headers: Optional[Mapping[str, str]] = None
     stream: Optional[bool] = False
 
+    # bumped whenever the method or URL of any response is reassigned, registries
+    # compare it to know whether responses grouped by (method, URL) are outdated
+    _match_key_version = 0
+
     def __init__(
         self,
         method: str,
@@ -390,42 +509,83 @@ class BaseResponse:
         *,
         passthrough: bool = False,
     ) -> None:
-        self.method: str = method
+        self._method: str = _canonical_method(method)
         # ensure the url has a default path set if the url is a string
-        self.url: "_URLPatternType" = _ensure_url_default_path(url)
+        self._url: "_URLPatternType" = _ensure_url_default_path(url)
 
-        if self._should_match_querystring(match_querystring):
-            match = tuple(match) + (
-                _query_string_matcher(urlsplit(self.url).query),  # type: ignore[arg-type]
-            )
+        # split the URL only once, query is required by both checks below
+        url_query = (
+            urlsplit(self.url).query
+            if isinstance(self.url, str) and "?" in self.url
+            else ""
+        )
+        if self._should_match_querystring(match_querystring, url_query):
+            match = tuple(match) + (_query_string_matcher(url_query),)
 
         self.match: "_MatcherIterable" = match
+        self._url_and_path: Optional[str] = None
+        self._url_prefix: str = ""
         self._calls: CallList = CallList()
-        self.passthrough = passthrough
+        self.passthrough: bool = passthrough
 
         self.status: int = 200
         self.body: "_Body" = ""
 
+        self._cmp_key: Optional[Tuple[str, str]] = None
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    @method.setter
+    def method(self, value: str) -> None:
+        self._method = _canonical_method(value)
+        self._cmp_key = None
+        BaseResponse._match_key_version += 1
+
+    @property
+    def body(self) -> "_Body":
+        return self._body
+
+    @body.setter
+    def body(self, value: "_Body") -> None:
+        self._body = value
+
+    @property
+    def url(self) -> "_URLPatternType":
+        return self._url
+
+    @url.setter
+    def url(self, value: "_URLPatternType") -> None:
+        self._url = value
+        # drop everything derived from the previous URL
+        self._url_and_path = None
+        self._url_prefix = ""
+        self._cmp_key = None
+        BaseResponse._match_key_version += 1
+
+    def _get_cmp_key(self) -> Tuple[str, str]:
+        if self._cmp_key is None:
+            # Can't simply do an equality check on the URL objects directly since __eq__
+            # isn't implemented for regex. It might seem to work as regex is using a cache
+            # to return the same regex instances, but it doesn't in all cases.
+            self._cmp_key = (
+                self.method,
+                self.url.pattern if isinstance(self.url, Pattern) else self.url,
+            )
+        return self._cmp_key
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, BaseResponse):
             return False
 
-        if self.method != other.method:
-            return False
-
-        # Can't simply do an equality check on the objects directly here since __eq__ isn't
-        # implemented for regex. It might seem to work as regex is using a cache to return
-        # the same regex instances, but it doesn't in all cases.
-        self_url = self.url.pattern if isinstance(self.url, Pattern) else self.url
-        other_url = other.url.pattern if isinstance(other.url, Pattern) else other.url
-
-        return self_url == other_url
+        return self._get_cmp_key() == other._get_cmp_key()
 
     def __ne__(self, other: Any) -> bool:
         return not self.__eq__(other)
 
     def _should_match_querystring(
-        self, match_querystring_argument: Union[bool, object]
+        self, match_querystring_argument: Union[bool, object], url_query: str
     ) -> Union[bool, object]:
         if isinstance(self.url, Pattern):
             # the old default from <= 0.9.0
@@ -443,7 +603,43 @@ class BaseResponse:
                 )
             return match_querystring_argument
 
-        return bool(urlsplit(self.url).query)
+        return bool(url_query)
+
+    def _prepare_url_match(self) -> None:
+        """Precompute normalized parts of the registered string URL for matching."""
+        assert isinstance(self.url, str)
+        url_and_path = _get_url_and_path(_clean_unicode(self.url))
+        self._url_and_path = url_and_path
+
+        scheme_end = url_and_path.find("://")
+        if scheme_end < 0:
+            self._url_prefix = ""
+            return
+        path_start = url_and_path.find("/", scheme_end + 3)
+        prefix = url_and_path if path_start < 0 else url_and_path[:path_start]
+        # compared case-insensitively, 'other' is lowercased before comparison
+        self._url_prefix = prefix.lower()
+
+    def _get_index_key(self) -> Optional[Tuple[str, str]]:
+        """Key used by registries to look up the response for a request.
+
+        See ``_get_request_index_key``. Returns None if the response could match
+        requests with different keys, eg regex URLs or custom ``matches``.
+        """
+        if (
+            not isinstance(self.url, str)
+            or type(self).matches is not BaseResponse.matches
+            or type(self)._url_matches is not BaseResponse._url_matches
+        ):
+            return None
+
+        if self._url_and_path is None:
+            try:
+                self._prepare_url_match()
+            except ValueError:
+                # invalid URL, let 'matches' report it
+                return None
+        return self.method, self._url_and_path  # type: ignore[return-value]
 
     def _url_matches(self, url: "_URLPatternType", other: str) -> bool:
         """Compares two URLs.
@@ -466,10 +662,21 @@ class BaseResponse:
 
         """
         if isinstance(url, str):
-            if _has_unicode(url):
-                url = _clean_unicode(url)
+            if url is self.url:
+                # registered URL is matched against every request, parse it only once
+                if self._url_and_path is None:
+                    self._prepare_url_match()
+                prefix = self._url_prefix
+                other_prefix = other[: len(prefix)].lower()
+                if other_prefix != prefix and _URL_PLAIN_PREFIX_RE.match(other):
+                    # scheme or netloc differ and would stay different after
+                    # normalization, no need to normalize 'other'
+                    return False
+                url_and_path = self._url_and_path
+            else:
+                url_and_path = _get_url_and_path(_clean_unicode(url))
 
-            return _get_url_and_path(url) == _get_url_and_path(other)
+            return url_and_path == _get_url_and_path(other)
 
         elif isinstance(url, Pattern) and url.match(other):
             return True
@@ -490,16 +697,19 @@ class BaseResponse:
 
     def get_headers(self) -> HTTPHeaderDict:
         headers = HTTPHeaderDict()  # Duplicate headers are legal
+        # runs on every request, read the public attributes only once
+        content_type = self.content_type
+        response_headers = self.headers
 
         # Add Content-Type if it exists and is not already in headers
-        if self.content_type and (
-            not self.headers or "Content-Type" not in self.headers
+        if content_type and (
+            not response_headers or "Content-Type" not in response_headers
         ):
-            headers["Content-Type"] = self.content_type
+            headers["Content-Type"] = content_type
 
         # Extend headers if they exist
-        if self.headers:
-            headers.extend(self.headers)
+        if response_headers:
+            headers.extend(response_headers)
 
         return headers
 
@@ -513,11 +723,7 @@ class BaseResponse:
         if not self._url_matches(self.url, str(request.url)):
             return False, "URL does not match"
 
-        valid, reason = self._req_attr_matches(self.match, request)
-        if not valid:
-            return False, reason
-
-        return True, ""
+        return self._req_attr_matches(self.match, request)
 
     @property
     def call_count(self) -> int:
@@ -528,6 +734,11 @@ class BaseResponse:
         return self._calls
 
 
+# ``body`` of the original response is never read, one closed buffer serves them all
+_CLOSED_BODY = BytesIO()
+_CLOSED_BODY.close()
+
+
 def _form_response(
     body: Union[BufferedReader, BytesIO],
     headers: Optional[Mapping[str, str]],
@@ -545,8 +756,7 @@ def _form_response(
     introduce potential errors.
     """
 
-    data = BytesIO()
-    data.close()
+    data = _CLOSED_BODY
 
     """
     The type `urllib3.response.HTTPResponse` is incorrect; we should
@@ -572,6 +782,14 @@ def _form_response(
 
 
 class Response(BaseResponse):
+    __slots__ = (
+        "auto_calculate_content_length",
+        "content_type",
+        "headers",
+        "stream",
+        "_body_bytes",
+    )
+
     def __init__(
         self,
         method: str,
@@ -601,20 +819,27 @@ class Response(BaseResponse):
             else:
                 content_type = "text/plain"
 
-        self.body: "_Body" = body
+        self.body = body
         self.status: int = status
         self.headers: Optional[Mapping[str, str]] = headers
 
         if stream is not None:
-            warn(
-                "stream argument is deprecated. Use stream parameter in request directly",
-                DeprecationWarning,
-            )
+            _warn_stream_deprecated()
 
         self.stream: Optional[bool] = stream
         self.content_type: str = content_type  # type: ignore[assignment]
         self.auto_calculate_content_length: bool = auto_calculate_content_length
 
+    @property
+    def body(self) -> "_Body":
+        return self._body
+
+    @body.setter
+    def body(self, value: "_Body") -> None:
+        self._body = value
+        # the body is static, encode it once here rather than on every request
+        self._body_bytes = value.encode("utf-8") if isinstance(value, str) else value
+
     def get_response(self, request: "PreparedRequest") -> HTTPResponse:
         if self.body and isinstance(self.body, Exception):
             setattr(self.body, "request", request)
@@ -623,15 +848,16 @@ class Response(BaseResponse):
         headers = self.get_headers()
         status = self.status
 
-        assert not isinstance(self.body, (Response, BaseException))
-        body = _handle_body(self.body)
+        assert not isinstance(self._body_bytes, (Response, BaseException))
+        body = _handle_body(self._body_bytes)
 
         if (
             self.auto_calculate_content_length
             and isinstance(body, BytesIO)
             and "Content-Length" not in headers
         ):
-            content_length = len(body.getvalue())
+            # the body bytes are kept on the stub, no need to copy the buffer
+            content_length = len(self._body_bytes or b"")  # type: ignore[arg-type]
             headers["Content-Length"] = str(content_length)
 
         return _form_response(body, headers, status, request.method)
@@ -663,10 +889,7 @@ class CallbackResponse(BaseResponse):
         self.callback = callback
 
         if stream is not None:
-            warn(
-                "stream argument is deprecated. Use stream parameter in request directly",
-                DeprecationWarning,
-            )
+            _warn_stream_deprecated()
         self.stream: Optional[bool] = stream
         self.content_type: Optional[str] = content_type
 
@@ -732,11 +955,11 @@ class RequestsMock:
         real_adapter_send: "_HTTPAdapterSend" = _real_send,
     ) -> None:
         self._calls: CallList = CallList()
+        self._registry_cls: Type[FirstMatchRegistry] = registry
         self.reset()
-        self._registry: FirstMatchRegistry = registry()  # call only after reset
         self.assert_all_requests_are_fired: bool = assert_all_requests_are_fired
         self.response_callback: Optional[Callable[[Any], Response]] = response_callback
-        self.passthru_prefixes: Tuple[_URLPatternType, ...] = tuple(passthru_prefixes)
+        self.passthru_prefixes = passthru_prefixes
         self.target: str = target
         self._patcher: Optional["_mock_patcher[Any]"] = None
         self._thread_lock = _ThreadingLock()
@@ -773,8 +996,11 @@ class RequestsMock:
 
     def reset(self) -> None:
         """Resets registry (including type), calls, passthru_prefixes to default values."""
-        self._registry = FirstMatchRegistry()
+        self._registry = self._registry_cls()
         self._calls.reset()
+        # URL caches are filled per test, do not let them outlive it
+        _ensure_url_default_path.cache_clear()
+        _get_url_and_path.cache_clear()
         self.passthru_prefixes = ()
 
     def add(
@@ -836,6 +1062,20 @@ class RequestsMock:
         response = Response(method=method, url=url, body=body, **kwargs)
         return self._registry.add(response)
 
+    def add_many(self, responses: Iterable[BaseResponse]) -> List[BaseResponse]:
+        """
+        Register several ``BaseResponse`` objects at once. Faster than calling
+        ``add`` in a loop when many responses are registered.
+
+        >>> import responses
+        >>> responses.add_many(
+        >>>     responses.Response(responses.GET, f"http://example.com/{i}")
+        >>>     for i in range(1000)
+        >>> )
+
+        """
+        return self._registry.add_many(responses)
+
     delete = partialmethod(add, DELETE)
     get = partialmethod(add, GET)
     head = partialmethod(add, HEAD)
@@ -986,6 +1226,21 @@ class RequestsMock:
     def calls(self) -> CallList:
         return self._calls
 
+    @property
+    def passthru_prefixes(self) -> Tuple["_URLPatternType", ...]:
+        return self._passthru_prefixes
+
+    @passthru_prefixes.setter
+    def passthru_prefixes(self, prefixes: Iterable["_URLPatternType"]) -> None:
+        self._passthru_prefixes: Tuple[_URLPatternType, ...] = tuple(prefixes)
+        # string prefixes are checked at once with a single 'str.startswith' call
+        self._passthru_str_prefixes: Tuple[str, ...] = tuple(
+            p for p in self._passthru_prefixes if isinstance(p, str)
+        )
+        self._passthru_re_matchers: Tuple[Callable[[str], Any], ...] = tuple(
+            p.match for p in self._passthru_prefixes if isinstance(p, Pattern)
+        )
+
     def __enter__(self) -> "RequestsMock":
         self.start()
         return self
@@ -1052,11 +1307,19 @@ class RequestsMock:
         self, url: str
     ) -> Dict[str, Union[str, int, float, List[Optional[Union[str, int, float]]]]]:
         params: Dict[str, Union[str, int, float, List[Any]]] = {}
-        for key, val in groupby(parse_qsl(urlsplit(url).query), lambda kv: kv[0]):
-            values = list(map(lambda x: x[1], val))
-            if len(values) == 1:
-                values = values[0]  # type: ignore[assignment]
-            params[key] = values
+        if "?" not in url:
+            # most mocked requests have no query string, skip URL parsing
+            return params
+
+        for key, val in parse_qsl(urlsplit(url).query):
+            if key not in params:
+                params[key] = val
+                continue
+            values = params[key]
+            if isinstance(values, list):
+                values.append(val)
+            else:
+                params[key] = [values, val]
         return params
 
     def _read_filelike_body(
@@ -1090,77 +1353,86 @@ class RequestsMock:
         request_url = str(request.url)
         request.body = self._read_filelike_body(request.body)
 
-        match, match_failed_reasons = self._find_match(request)
-        resp_callback = self.response_callback
-
-        if match is None:
-            if any(
-                [
-                    p.match(request_url)
-                    if isinstance(p, Pattern)
-                    else request_url.startswith(p)
-                    for p in self.passthru_prefixes
-                ]
-            ):
-                logger.info("request.allowed-passthru", extra={"url": request_url})
-                return self._real_send(adapter, request, **kwargs)  # type: ignore
-
-            error_msg = (
-                "Connection refused by Responses - the call doesn't "
-                "match any registered mock.\n\n"
-                "Request: \n"
-                f"- {request.method} {request_url}\n\n"
-                "Available matches:\n"
-            )
-            for i, m in enumerate(self.registered()):
-                error_msg += "- {} {} {}\n".format(
-                    m.method, m.url, match_failed_reasons[i]
+        retries = retries or adapter.max_retries
+        # retried requests are matched again, loop instead of recursing per retry
+        while True:
+            match, match_failed_reasons = self._find_match(request)
+            resp_callback = self.response_callback
+
+            if match is None:
+                if self._passthru_prefixes and (
+                    request_url.startswith(self._passthru_str_prefixes)
+                    or any(
+                        match_re(request_url) for match_re in self._passthru_re_matchers
+                    )
+                ):
+                    logger.info("request.allowed-passthru", extra={"url": request_url})
+                    return self._real_send(adapter, request, **kwargs)  # type: ignore
+
+                error_msg = (
+                    "Connection refused by Responses - the call doesn't "
+                    "match any registered mock.\n\n"
+                    "Request: \n"
+                    f"- {request.method} {request_url}\n\n"
+                    "Available matches:\n"
                 )
+                for i, m in enumerate(self.registered()):
+                    error_msg += "- {} {} {}\n".format(
+                        m.method, m.url, match_failed_reasons[i]
+                    )
 
-            if self.passthru_prefixes:
-                error_msg += "Passthru prefixes:\n"
-                for p in self.passthru_prefixes:
-                    error_msg += f"- {p}\n"
+                if self.passthru_prefixes:
+                    error_msg += "Passthru prefixes:\n"
+                    for p in self.passthru_prefixes:
+                        error_msg += f"- {p}\n"
 
-            response = ConnectionError(error_msg)
-            response.request = request
+                response = ConnectionError(error_msg)
+                response.request = request
 
-            self._calls.add(request, response)
-            raise response
+                self._calls.add(request, response)
+                raise response
 
-        if match.passthrough:
-            logger.info("request.passthrough-response", extra={"url": request_url})
-            response = self._real_send(adapter, request, **kwargs)  # type: ignore
-        else:
-            try:
-                response = adapter.build_response(  # type: ignore[assignment]
-                    request, match.get_response(request)
-                )
-            except BaseException as response:
-                call = Call(request, response)
-                self._calls.add_call(call)
-                match.calls.add_call(call)
-                raise
-
-        if resp_callback:
-            response = resp_callback(response)  # type: ignore[misc]
-        call = Call(request, response)  # type: ignore[misc]
-        self._calls.add_call(call)
-        match.calls.add_call(call)
+            if match.passthrough:
+                logger.info("request.passthrough-response", extra={"url": request_url})
+                response = self._real_send(adapter, request, **kwargs)  # type: ignore
+            else:
+                try:
+                    response = adapter.build_response(  # type: ignore[assignment]
+                        request, match.get_response(request)
+                    )
+                except BaseException as response:
+                    call = Call(request, response)
+                    self._calls.add_call(call)
+                    match.calls.add_call(call)
+                    raise
+
+            if resp_callback:
+                response = resp_callback(response)  # type: ignore[misc]
+            call = Call(request, response)  # type: ignore[misc]
+            self._calls.add_call(call)
+            match.calls.add_call(call)
+
+            # first validate that current request is eligible to be retried.
+            # See ``urllib3.util.retry.Retry`` documentation.
+            # Without total retries and status_forcelist, eg the default `HTTPAdapter`
+            # retries, `is_retry` is always False.
+            retries_disabled = not retries.total and not retries.status_forcelist
+            if retries_disabled:
+                return response
+
+            request_method = response.request.method  # type: ignore[misc]
+            if not retries.is_retry(
+                method=request_method,
+                status_code=response.status_code,  # type: ignore[misc]
+            ):
+                return response
 
-        retries = retries or adapter.max_retries
-        # first validate that current request is eligible to be retried.
-        # See ``urllib3.util.retry.Retry`` documentation.
-        if retries.is_retry(
-            method=response.request.method, status_code=response.status_code  # type: ignore[misc]
-        ):
             try:
                 retries = retries.increment(
-                    method=response.request.method,  # type: ignore[misc]
+                    method=request_method,
                     url=response.url,  # type: ignore[misc]
                     response=response.raw,  # type: ignore[misc]
                 )
-                return self._on_request(adapter, request, retries=retries, **kwargs)
             except MaxRetryError as e:
                 if retries.raise_on_status:
                     """Since we call 'retries.increment()' by ourselves, we always set "error"
@@ -1175,7 +1447,6 @@ class RequestsMock:
                     raise RetryError(e, request=request)
 
                 return response
-        return response
 
     def unbound_on_send(self) -> "UnboundSend":
         def send(
@@ -1228,7 +1499,7 @@ class RequestsMock:
         if not allow_assert:
             return
 
-        not_called = [m for m in self.registered() if m.call_count == 0]
+        not_called = [m for m in self.registered() if not m.calls]
         if not_called:
             raise AssertionError(
                 "Not all requests have been executed {!r}".format(
@@ -1237,12 +1508,8 @@ class RequestsMock:
             )
 
     def assert_call_count(self, url: str, count: int) -> bool:
-        call_count = len(
-            [
-                1
-                for call in self.calls
-                if call.request.url == _ensure_url_default_path(url)
-            ]
+        call_count = self._calls._url_call_count(
+            _ensure_url_default_path(url)  # type: ignore[arg-type]
         )
         if call_count == count:
             return True
@@ -1261,6 +1528,7 @@ __all__ = [
     # Exposed by the RequestsMock class:
     "activate",
     "add",
+    "add_many",
     "_add_from_file",
     "add_callback",
     "add_passthru",
@@ -1296,6 +1564,7 @@ __all__ = [
 # expose only methods and/or read-only methods
 activate = _default_mock.activate
 add = _default_mock.add
+add_many = _default_mock.add_many
 _add_from_file = _default_mock._add_from_file
 add_callback = _default_mock.add_callback
 add_passthru = _default_mock.add_passthru
@@ -1329,13 +1598,16 @@ upsert = _default_mock.upsert
 
 
 deprecated_names = ["assert_all_requests_are_fired", "passthru_prefixes", "target"]
+_deprecated_attributes = {
+    name: globals()[f"_deprecated_{name}"] for name in deprecated_names
+}
 
 
 def __getattr__(name: str) -> Any:
-    if name in deprecated_names:
+    if name in _deprecated_attributes:
         warn(
             f"{name} is deprecated. Please use 'responses.mock.{name}",
             DeprecationWarning,
         )
-        return globals()[f"_deprecated_{name}"]
+        return _deprecated_attributes[name]
     raise AttributeError(f"module {__name__} has no attribute {name}")
@@ -223,13 +223,15 @@ def query_string_matcher(query: Optional[str]) -> Callable[..., Any]:
     :return: (func) matcher
     """
 
+    # parse the expected query once, not on every request
+    matcher_qsl = sorted(parse_qsl(query)) if query else {}
+
     def match(request: PreparedRequest) -> Tuple[bool, str]:
         reason = ""
         data = parse_url(request.url or "")
         request_query = data.query
 
         request_qsl = sorted(parse_qsl(request_query)) if request_query else {}
-        matcher_qsl = sorted(parse_qsl(query)) if query else {}
 
         valid = not query if request_query is None else request_qsl == matcher_qsl
 
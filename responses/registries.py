@@ -1,5 +1,9 @@
 import copy
+from operator import is_
+from operator import itemgetter
 from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -10,10 +14,16 @@ if TYPE_CHECKING:  # pragma: no cover
 
     from responses import BaseResponse
 
+    _Index = Dict[Optional[Tuple[str, str]], List[Tuple[int, BaseResponse]]]
+
 
 class FirstMatchRegistry:
     def __init__(self) -> None:
         self._responses: List["BaseResponse"] = []
+        self._index: Optional["_Index"] = None
+        # state the index was built from, see ``_index_is_current``
+        self._indexed: List["BaseResponse"] = []
+        self._indexed_version = -1
 
     @property
     def registered(self) -> List["BaseResponse"]:
@@ -21,20 +31,90 @@ class FirstMatchRegistry:
 
     def reset(self) -> None:
         self._responses = []
+        self._index = None
 
-    def find(
+    def _build_index(self) -> "_Index":
+        """Group registered responses by their (method, URL) match key.
+
+        Responses that cannot be keyed, eg with regex URLs or custom ``matches``,
+        are stored under ``None`` and are candidates for every request. They are
+        also merged into every other group, in registration order, so that a
+        lookup returns the final list of candidates.
+
+        Costs: building is O(N log N) and runs again after any change, see
+        ``_index_is_current``. Because of the merge, the index holds
+        O(keys * unkeyed responses) entries, so suites mixing many distinct URLs
+        with many regex URLs trade memory for the faster lookups.
+        """
+        from responses import BaseResponse
+
+        self._indexed = list(self.registered)
+        self._indexed_version = BaseResponse._match_key_version
+
+        index: "_Index" = {None: []}
+        for i, response in enumerate(self.registered):
+            key = response._get_index_key()
+            index.setdefault(key, []).append((i, response))
+
+        unindexed = index[None]
+        if unindexed:
+            for key, candidates in index.items():
+                if key is not None:
+                    index[key] = sorted(candidates + unindexed, key=itemgetter(0))
+        return index
+
+    def _index_is_current(self) -> bool:
+        """Whether the index still reflects the registered responses.
+
+        Besides the registry methods, ``registered`` can be edited directly and the
+        method or URL of a registered response can be reassigned.
+
+        Costs: every lookup compares the registered list to the indexed one by
+        identity, O(N) but done in C and far cheaper than calling ``matches`` on
+        every response. Reassigned methods and URLs are tracked through
+        ``BaseResponse._match_key_version``, a process-wide counter, so such a
+        reassignment rebuilds the index of every registry on its next lookup.
+        """
+        from responses import BaseResponse
+
+        registered = self.registered
+        return (
+            self._index is not None
+            and self._indexed_version == BaseResponse._match_key_version
+            and len(self._indexed) == len(registered)
+            and all(map(is_, self._indexed, registered))
+        )
+
+    def _get_candidates(
         self, request: "PreparedRequest"
+    ) -> List[Tuple[int, "BaseResponse"]]:
+        from responses import _get_request_index_key
+
+        if not self._index_is_current():
+            self._index = self._build_index()
+        assert self._index is not None
+
+        key = _get_request_index_key(request)
+        if key in self._index:
+            return self._index[key]
+        return self._index[None]
+
+    def _find_in(
+        self,
+        candidates: Iterable[Tuple[int, "BaseResponse"]],
+        request: "PreparedRequest",
     ) -> Tuple[Optional["BaseResponse"], List[str]]:
         found = None
         found_match = None
         match_failed_reasons = []
-        for i, response in enumerate(self.registered):
+        for i, response in candidates:
             match_result, reason = response.matches(request)
             if match_result:
                 if found is None:
                     found = i
                     found_match = response
                 else:
+                    self._index = None
                     if self.registered[found].call_count > 0:
                         # that assumes that some responses were added between calls
                         self.registered.pop(found)
@@ -46,6 +126,20 @@ class FirstMatchRegistry:
                 match_failed_reasons.append(reason)
         return found_match, match_failed_reasons
 
+    def find(
+        self, request: "PreparedRequest"
+    ) -> Tuple[Optional["BaseResponse"], List[str]]:
+        if len(self.registered) < 2:
+            # nothing to narrow down, skip keying the request
+            return self._find_in(enumerate(self.registered), request)
+
+        candidates = self._get_candidates(request)
+        found_match, match_failed_reasons = self._find_in(candidates, request)
+        if found_match is None and len(candidates) < len(self.registered):
+            # the reasons are reported for every registered response
+            return self._find_in(enumerate(self.registered), request)
+        return found_match, match_failed_reasons
+
     def add(self, response: "BaseResponse") -> "BaseResponse":
         if any(response is resp for resp in self.registered):
             # if user adds multiple responses that reference the same instance.
@@ -54,13 +148,43 @@ class FirstMatchRegistry:
             response = copy.deepcopy(response)
 
         self.registered.append(response)
+        self._index = None
         return response
 
+    def add_many(self, responses: Iterable["BaseResponse"]) -> List["BaseResponse"]:
+        """Add several responses at once, see ``add``.
+
+        The registry is scanned for already registered instances only once instead of
+        on every added response. If a subclass overrides ``add``, every response is
+        passed to it instead.
+        """
+        from responses import BaseResponse
+
+        if type(self).add is not FirstMatchRegistry.add:
+            return [self.add(response) for response in responses]
+
+        registered_ids = {id(resp) for resp in self.registered}
+        added = []
+        for response in responses:
+            if not isinstance(response, BaseResponse):
+                raise TypeError(
+                    f"Expected 'BaseResponse' instances, got {type(response).__name__}"
+                )
+            if id(response) in registered_ids:
+                response = copy.deepcopy(response)
+            registered_ids.add(id(response))
+            added.append(response)
+
+        self.registered.extend(added)
+        self._index = None
+        return added
+
     def remove(self, response: "BaseResponse") -> List["BaseResponse"]:
         removed_responses = []
         while response in self.registered:
             self.registered.remove(response)
             removed_responses.append(response)
+        self._index = None
         return removed_responses
 
     def replace(self, response: "BaseResponse") -> "BaseResponse":
@@ -69,6 +193,7 @@ class FirstMatchRegistry:
         except ValueError:
             raise ValueError(f"Response is not registered for URL {response.url}")
         self.registered[index] = response
+        self._index = None
         return response
 
 
@@ -1,3 +1,6 @@
+import re
+from typing import Any
+
 import pytest
 import requests
 from requests.exceptions import ConnectionError
@@ -112,6 +115,118 @@ def test_registry_reset():
     assert_reset()
 
 
+def test_registry_type_kept_after_reset():
+    def run():
+        class CustomRegistry(registries.FirstMatchRegistry):
+            pass
+
+        with responses.RequestsMock(
+            assert_all_requests_are_fired=False, registry=CustomRegistry
+        ) as rsps:
+            rsps._set_registry(OrderedRegistry)
+            rsps.reset()
+            assert type(rsps.get_registry()) == CustomRegistry
+
+    run()
+    assert_reset()
+
+
+def test_first_match_registry_keeps_registration_order():
+    @responses.activate
+    def run():
+        for i in range(10):
+            responses.add(responses.GET, f"http://example.com/{i}", status=200 + i)
+        responses.add(
+            responses.GET, re.compile(r"http://example\.com/1\d+"), status=500
+        )
+        responses.add(responses.GET, "http://example.com/15", status=515)
+        responses.add(responses.POST, "http://example.com/15", status=415)
+
+        assert requests.get("http://example.com/3").status_code == 203
+        assert requests.get("http://example.com/15").status_code == 500
+        # second registered match is used once the first one was called
+        assert requests.get("http://example.com/15").status_code == 515
+        assert requests.post("http://example.com/15").status_code == 415
+
+        with pytest.raises(ConnectionError) as excinfo:
+            requests.get("http://example.com/foo")
+        msg = str(excinfo.value)
+        # all registered responses are reported
+        assert "- GET http://example.com/0 URL does not match" in msg
+        assert "- POST http://example.com/15 Method does not match" in msg
+
+    run()
+    assert_reset()
+
+
+def test_first_match_registry_direct_edits():
+    @responses.activate
+    def run():
+        responses.add(responses.GET, "http://a.com/1", body="one")
+        responses.add(responses.GET, "http://a.com/2", body="two-a")
+        responses.add(responses.GET, "http://a.com/2", body="two-b")
+        assert requests.get("http://a.com/1").text == "one"
+
+        responses.registered().insert(
+            0, responses.Response(responses.GET, "http://a.com/9")
+        )
+        assert requests.get("http://a.com/2").text == "two-a"
+        assert requests.get("http://a.com/1").text == "one"
+
+    run()
+    assert_reset()
+
+
+def test_first_match_registry_method_reassigned():
+    @responses.activate
+    def run():
+        first = responses.add(responses.POST, "http://a.com/", body="first")
+        responses.add(responses.GET, "http://a.com/", body="second")
+        responses.add(responses.GET, "http://a.com/other", body="other")
+        assert requests.get("http://a.com/other").text == "other"
+
+        first.method = responses.GET
+        assert requests.get("http://a.com/").text == "first"
+
+    run()
+    assert_reset()
+
+
+def test_add_many_uses_overridden_add():
+    class CustomRegistry(registries.FirstMatchRegistry):
+        def add(self, response):
+            response.status = 201
+            return super().add(response)
+
+    @responses.activate(registry=CustomRegistry)
+    def run():
+        responses.add_many(
+            [
+                responses.Response(responses.GET, "http://a.com/1"),
+                responses.Response(responses.GET, "http://a.com/2"),
+            ]
+        )
+        assert requests.get("http://a.com/1").status_code == 201
+        assert requests.get("http://a.com/2").status_code == 201
+
+    run()
+    assert_reset()
+
+
+def test_add_many_rejects_non_responses():
+    @responses.activate
+    def run():
+        not_a_response: Any = "http://a.com/2"
+        with pytest.raises(TypeError):
+            responses.add_many(
+                [responses.Response(responses.GET, "http://a.com/1"), not_a_response]
+            )
+        assert not responses.registered()
+
+    run()
+    assert_reset()
+
+
 class TestOrderedRegistry:
     def test_invocation_index(self):
         @responses.activate(registry=OrderedRegistry)
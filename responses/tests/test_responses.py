@@ -1,8 +1,10 @@
+import copy
 import inspect
 import os
 import re
 import tempfile
 import warnings
+import weakref
 from io import BufferedReader
 from io import BytesIO
 from typing import Any
@@ -282,6 +284,31 @@ def test_upsert_add(original, replacement):  # type: ignore[misc]
     assert_reset()
 
 
+def test_add_many():
+    @responses.activate
+    def run():
+        rsp = Response(responses.GET, "http://example.com/1", status=201)
+        added = responses.add_many(
+            [
+                Response(responses.GET, "http://example.com/0", status=200),
+                rsp,
+                rsp,
+            ]
+        )
+        assert len(added) == 3
+        assert added[1] is rsp
+        # the same instance is copied, as done by `add`
+        assert added[2] is not rsp
+        assert responses.registered() == added
+
+        assert requests.get("http://example.com/0").status_code == 200
+        assert requests.get("http://example.com/1").status_code == 201
+        assert responses.assert_call_count("http://example.com/1", 1)
+
+    run()
+    assert_reset()
+
+
 def test_remove():
     @responses.activate
     def run():
@@ -498,6 +525,78 @@ def test_accept_string_body():
     assert_reset()
 
 
+def test_replace_string_body_after_add():
+    @responses.activate
+    def run():
+        url = "http://example.com/"
+        rsp = responses.add(responses.GET, url, body="test")
+        assert requests.get(url).content == b"test"
+
+        rsp.body = "ünïcode"
+        assert requests.get(url).content == "ünïcode".encode("utf-8")
+
+        rsp.body = b"bytes"
+        assert requests.get(url).content == b"bytes"
+
+    run()
+    assert_reset()
+
+
+def test_replace_url_after_add():
+    @responses.activate
+    def run():
+        rsp = responses.add(responses.GET, "http://a.com/x")
+        assert requests.get("http://a.com/x").status_code == 200
+
+        rsp.url = "http://a.com/y"
+        assert requests.get("http://a.com/y").status_code == 200
+        with pytest.raises(ConnectionError):
+            requests.get("http://a.com/x")
+
+        assert rsp == Response(responses.GET, "http://a.com/y")
+        rsp.method = responses.POST
+        assert rsp == Response(responses.POST, "http://a.com/y")
+
+    run()
+    assert_reset()
+
+
+def test_base_response_subclass_defaults():
+    class JSONResponse(BaseResponse):
+        content_type = "application/json"
+        headers = {"X-A": "1"}
+
+    rsp = JSONResponse(responses.GET, "http://example.com/")
+    assert dict(rsp.get_headers()) == {"Content-Type": "application/json", "X-A": "1"}
+    assert rsp.stream is False
+
+    for response in (rsp, Response(responses.GET, "http://example.com/")):
+        assert weakref.ref(response)() is response
+
+
+def test_replace_headers_after_add():
+    @responses.activate
+    def run():
+        url = "http://example.com/"
+        headers = {"X-Test": "foo"}
+        rsp = responses.add(responses.GET, url, headers=headers)
+        assert isinstance(rsp, Response)
+        assert requests.get(url).headers["X-Test"] == "foo"
+
+        headers["X-Test"] = "bar"
+        assert requests.get(url).headers["X-Test"] == "bar"
+
+        rsp.headers = {"X-Other": "baz"}
+        rsp.content_type = "application/json"
+        resp = requests.get(url)
+        assert "X-Test" not in resp.headers
+        assert resp.headers["X-Other"] == "baz"
+        assert resp.headers["Content-Type"] == "application/json"
+
+    run()
+    assert_reset()
+
+
 def test_accept_json_body():
     @responses.activate
     def run():
@@ -1313,6 +1412,23 @@ def test_handles_unicode_url():
     assert_reset()
 
 
+@pytest.mark.parametrize(
+    "url",
+    ("http://straße.de/test", "http://例え.テスト:8080/test"),
+)
+def test_handles_unicode_host(url):  # type: ignore[misc]
+    @responses.activate
+    def run():
+        responses.add(responses.GET, url, body="test")
+
+        resp = requests.get(url)
+
+        assert_response(resp, "test")
+
+    run()
+    assert_reset()
+
+
 def test_handles_unicode_body():
     url = "http://example.com/test"
 
@@ -1677,6 +1793,30 @@ def test_multiple_methods():
     assert_reset()
 
 
+def test_lowercase_method():
+    @responses.activate
+    def run():
+        responses.add("get", "http://example.com/one", body="gotcha")
+        responses.add("propfind", "http://example.com/one", body="found")
+
+        resp = requests.get("http://example.com/one")
+        assert_response(resp, "gotcha")
+        resp = requests.request("PROPFIND", "http://example.com/one")
+        assert_response(resp, "found")
+
+        responses.remove("GET", "http://example.com/one")
+        assert len(responses.registered()) == 1
+
+        rsp = responses.registered()[0]
+        rsp.method = "post"
+        assert rsp.method == "POST"
+        resp = requests.post("http://example.com/one")
+        assert_response(resp, "found")
+
+    run()
+    assert_reset()
+
+
 class TestPassthru:
     def test_passthrough_flag(self, httpserver):
         httpserver.expect_request("/").respond_with_data(
@@ -1983,6 +2123,19 @@ def test_request_param_with_multiple_values_for_the_same_key():
     assert_reset()
 
 
+def test_request_param_with_non_adjacent_values_for_the_same_key():
+    @responses.activate
+    def run():
+        url = "http://example.com"
+        responses.add(method=responses.GET, url=url, body="test")
+        resp = requests.get(f"{url}?key1=one&key2=three&key1=two")
+        assert_response(resp, "test")
+        assert_params(resp, {"key1": ["one", "two"], "key2": "three"})
+
+    run()
+    assert_reset()
+
+
 @pytest.mark.parametrize(
     "url", ("http://example.com", "http://example.com?hello=world")
 )
@@ -2017,6 +2170,37 @@ def test_assert_call_count(url):  # type: ignore[misc]
     assert_reset()
 
 
+def test_assert_call_count_after_editing_calls():
+    @responses.activate
+    def run():
+        url = "http://example.com/"
+        responses.add(responses.GET, url)
+        requests.get(url)
+        requests.get(url)
+        assert responses.assert_call_count(url, 2) is True
+
+        responses.calls.pop()
+        assert responses.assert_call_count(url, 1) is True
+
+        responses.calls.append(responses.calls[0])
+        assert responses.assert_call_count(url, 2) is True
+
+        calls = copy.copy(responses.calls)
+        assert len(calls) == 2
+        assert calls._url_call_count(url) == 2
+        assert copy.deepcopy(calls)._url_call_count(url) == 2
+        assert responses.assert_call_count(url, 2) is True
+
+        del responses.calls[:]
+        assert responses.assert_call_count(url, 0) is True
+
+        requests.get(url)
+        assert responses.assert_call_count(url, 1) is True
+
+    run()
+    assert_reset()
+
+
 def test_call_count_with_matcher():
     @responses.activate
     def run():
@@ -2231,6 +2415,11 @@ def test_mocked_responses_list_registered():
         ("http://service-a/foo", "http://service-A/foo"),
         ("http://someHost-AwAy/", "http://somehost-away/"),
         ("http://fizzbuzz/foo", "http://fizzbuzz/foo"),
+        ("http://fizzbuzz/foo bar", "http://fizzbuzz/foo%20bar"),
+        ("http://fizzbuzz/foo/../bar", "http://fizzbuzz/bar"),
+        ("http://example.com:/a", "http://example.com/a"),
+        ("http://example.com:080/a", "http://example.com:80/a"),
+        ("http://ex%41.com/a", "http://exa.com/a"),
     ],
 )
 def test_rfc_compliance(url, other_url):  # type: ignore[misc]
@@ -2244,6 +2433,38 @@ def test_rfc_compliance(url, other_url):  # type: ignore[misc]
     assert_reset()
 
 
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("http://example.com", "http://example.com/"),
+        ("http://example.com?q=fizz", "http://example.com/?q=fizz"),
+        ("http://example.com:8080#frag", "http://example.com:8080/#frag"),
+        ("http://example.com/foo?next=/bar", "http://example.com/foo?next=/bar"),
+        ("example.com?next=http://example.org", "example.com?next=http://example.org"),
+        ("HTTP://example.com", "http://example.com/"),
+        ("http://example.com?", "http://example.com/"),
+    ],
+)
+def test_url_default_path(url, expected):  # type: ignore[misc]
+    assert BaseResponse(method=responses.GET, url=url).url == expected
+
+
+@pytest.mark.parametrize(
+    "url,other_url,expected",
+    [
+        ("http://ex%41.com/a", "http://ex%41.com/a", True),
+        ("http://ex%41.com/a", "http://exa.com/a", True),
+        ("http://example.com:080/a", "http://example.com:080/a", True),
+        ("http://example.com:80/a", "http://example.com:080/a", True),
+        ("http://example.com/a", "http://example.org/a", False),
+        ("http://example.com/a", "https://example.com/a", False),
+    ],
+)
+def test_url_matches_normalizes_other(url, other_url, expected):  # type: ignore[misc]
+    response = BaseResponse(method=responses.GET, url=url)
+    assert response._url_matches(response.url, other_url) is expected
+
+
 def test_requests_between_add():
     @responses.activate
     def run():